@@ -6,6 +6,12 @@ from cloudshell.networking.cisco.cli.cisco_cli_handler import CiscoCliHandler
 from cloudshell.networking.cisco.cli.cisco_command_modes import EnableCommandMode, ConfigCommandMode
 from cloudshell.networking.cisco.iosxr.cli.cisco_iosxr_command_modes import CiscoIOSXRConfigCommandMode, \
     CiscoIOSXRAdminCommandMode
+from cloudshell.networking.cisco.iosxr.sessions.cisco_iosxr_ssh_session import CiscoIOSXRSSHSession
+
+TERMINAL_SETTINGS_COMMANDS = ["terminal length 0", "terminal width 300"]
+# Intermediate prompts are echoed back between the batched commands,
+# so only the prompt following the last command completes the expect
+TERMINAL_SETTINGS_PROMPT = r"{0}.*{1}".format(TERMINAL_SETTINGS_COMMANDS[-1], EnableCommandMode.PROMPT)
 
 
 class CiscoIOSXRCliHandler(CiscoCliHandler):
@@ -17,13 +23,17 @@ class CiscoIOSXRCliHandler(CiscoCliHandler):
     def admin_mode(self):
         return self.modes[CiscoIOSXRAdminCommandMode]
 
+    def _ssh_session(self):
+        return CiscoIOSXRSSHSession(self.resource_address, self.username, self.password, self.port,
+                                    self.on_session_start)
+
     def on_session_start(self, session, logger):
         """Send default commands to configure/clear session outputs
         :return:
         """
 
         cli_service = CliServiceImpl(session=session, command_mode=self.enable_mode, logger=logger)
-        cli_service.send_command("terminal length 0", EnableCommandMode.PROMPT)
-        cli_service.send_command("terminal width 300", EnableCommandMode.PROMPT)
+        cli_service.send_command("\n".join(TERMINAL_SETTINGS_COMMANDS), TERMINAL_SETTINGS_PROMPT,
+                                 remove_command_from_output=False)
         with cli_service.enter_mode(self.config_mode) as config_session:
-            config_session.send_command("no logging console", ConfigCommandMode.PROMPT)
\ No newline at end of file
+            config_session.send_command("no logging console", ConfigCommandMode.PROMPT)
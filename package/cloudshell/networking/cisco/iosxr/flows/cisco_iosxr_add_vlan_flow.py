@@ -23,7 +23,7 @@ class CiscoIOSXRAddVlanFlow(AddVlanFlow):
         :return:
         """
 
-        self._logger.info("Add VLAN(s) {} configuration started".format(vlan_range))
+        self._logger.info("Add VLAN(s) %s configuration started", vlan_range)
 
         with self._cli_handler.get_cli_service(self._cli_handler.config_mode) as config_session:
             iface_action = IOSXRIFaceActions(config_session, self._logger)
@@ -45,5 +45,5 @@ class CiscoIOSXRAddVlanFlow(AddVlanFlow):
             if port_name not in current_config:
                 raise Exception(self.__class__.__name__, "[FAIL] VLAN(s) {} configuration failed".format(vlan_range))
 
-        self._logger.info("VLAN(s) {} configuration completed successfully".format(vlan_range))
+        self._logger.info("VLAN(s) %s configuration completed successfully", vlan_range)
         return "[ OK ] VLAN(s) {} configuration completed successfully".format(vlan_range)
@@ -22,7 +22,7 @@ class CiscoIOSXRRemoveVlanFlow(RemoveVlanFlow):
         :return:
         """
 
-        self._logger.info("Remove Vlan {} configuration started".format(vlan_range))
+        self._logger.info("Remove Vlan %s configuration started", vlan_range)
         with self._cli_handler.get_cli_service(self._cli_handler.config_mode) as config_session:
             iface_action = IOSXRIFaceActions(config_session, self._logger)
             vlan_actions = CiscoIOSXRAddRemoveVlanActions(config_session, self._logger)
@@ -37,5 +37,5 @@ class CiscoIOSXRRemoveVlanFlow(RemoveVlanFlow):
             if vlan_actions.verify_interface_configured(vlan_range, current_config):
                 raise Exception(self.__class__.__name__, "[FAIL] VLAN(s) {} removing failed".format(vlan_range))
 
-        self._logger.info("VLAN(s) {} removing completed successfully".format(vlan_range))
+        self._logger.info("VLAN(s) %s removing completed successfully", vlan_range)
         return "[ OK ] VLAN(s) {} removing completed successfully".format(vlan_range)
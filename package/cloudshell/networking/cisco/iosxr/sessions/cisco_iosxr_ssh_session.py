@@ -0,0 +1,129 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import re
+import time
+from collections import OrderedDict
+
+from cloudshell.cli.helper.normalize_buffer import normalize_buffer
+from cloudshell.cli.session.expect_session import ActionLoopDetector
+from cloudshell.cli.session.session_exceptions import SessionLoopDetectorException, SessionLoopLimitException, \
+    ExpectedSessionException, CommandExecutionException
+from cloudshell.cli.session.ssh_session import SSHSession
+
+
+class CiscoIOSXRSSHSession(SSHSession):
+    """SSH session with a larger read buffer and a tail-only prompt search
+
+    hardware_expect is copied from cloudshell-cli 3.2.2 ExpectSession.hardware_expect
+    and relies on _generate_command_pattern added in that version,
+    re-check it against upstream whenever the cloudshell-cli pin is raised.
+    """
+
+    BUFFER_SIZE = 65535
+    PROMPT_MATCH_OVERLAP = 4096
+
+    def hardware_expect(self, command, expected_string, logger, action_map=None, error_map=None,
+                        timeout=None, retries=None, check_action_loop_detector=True, empty_loop_timeout=None,
+                        remove_command_from_output=True, **optional_args):
+        """Get response form the device and compare it to action_map, error_map and expected_string patterns,
+        perform actions specified in action_map if any, and return output.
+
+        Same flow as ExpectSession.hardware_expect, but expected_string and action_map patterns
+        are verified against the recently received output only. The base implementation searches
+        the whole accumulated output after every read, which makes long outputs quadratic.
+        Only the last received chunk plus PROMPT_MATCH_OVERLAP characters before it are searched,
+        which still covers prompts split between reads.
+
+        :param command: command to send
+        :param expected_string: expected string
+        :param logger: logger
+        :param action_map: dict with {re_str: action} to trigger some action on received string
+        :param error_map: expected error map
+        :param timeout: session timeout
+        :param retries: maximal retries count
+        :param remove_command_from_output: In some switches the output string includes the command which was called.
+            The flag used to verify whether the the command string removed from the output string.
+        :rtype: str
+        """
+
+        if not action_map:
+            action_map = OrderedDict()
+
+        if not error_map:
+            error_map = OrderedDict()
+
+        retries = retries or self._max_loop_retries
+        empty_loop_timeout = empty_loop_timeout or self._empty_loop_timeout
+
+        if command is not None:
+            self._clear_buffer(self._clear_buffer_timeout, logger)
+
+            logger.debug('Command: {}'.format(command))
+            self.send_line(command, logger)
+
+        if not expected_string:
+            raise ExpectedSessionException(self.__class__.__name__, 'List of expected messages can\'t be empty!')
+
+        output_list = list()
+        output_str = ''
+        retries_count = 0
+        is_correct_exit = False
+
+        action_loop_detector = ActionLoopDetector(self._loop_detector_max_action_loops,
+                                                  self._loop_detector_max_combination_length)
+
+        while retries == 0 or retries_count < retries:
+            read_buffer = self._receive_all(timeout, logger)
+
+            if read_buffer:
+                read_buffer = normalize_buffer(read_buffer)
+                logger.debug(read_buffer)
+                output_str += read_buffer
+                if command and remove_command_from_output:
+                    command_pattern = self._generate_command_pattern(command)
+                    if re.search(command_pattern, output_str, flags=re.MULTILINE):
+                        output_str = re.sub(command_pattern, '', output_str, count=1, flags=re.MULTILINE)
+                        remove_command_from_output = False
+                retries_count = 0
+            else:
+                retries_count += 1
+                time.sleep(empty_loop_timeout)
+                continue
+
+            search_start = max(0, len(output_str) - len(read_buffer) - self.PROMPT_MATCH_OVERLAP)
+
+            if re.compile(expected_string, re.DOTALL).search(output_str, search_start):
+                output_list.append(output_str)
+                is_correct_exit = True
+
+            for action_key in action_map:
+                if re.compile(action_key, re.DOTALL).search(output_str, search_start):
+                    output_list.append(output_str)
+
+                    if check_action_loop_detector:
+                        if action_loop_detector.loops_detected(action_key):
+                            logger.error('Loops detected')
+                            raise SessionLoopDetectorException(self.__class__.__name__,
+                                                               'Expected actions loops detected')
+                    logger.debug('Action key: {}'.format(action_key))
+                    action_map[action_key](self, logger)
+                    output_str = ''
+                    break
+
+            if is_correct_exit:
+                break
+
+        if not is_correct_exit:
+            raise SessionLoopLimitException(self.__class__.__name__,
+                                            'Session Loop limit exceeded, {} loops'.format(retries_count))
+
+        result_output = ''.join(output_list)
+
+        for error_string in error_map:
+            if re.search(error_string, result_output, re.DOTALL):
+                raise CommandExecutionException(self.__class__.__name__,
+                                                'Session returned \'{}\''.format(error_map[error_string]))
+
+        result_output += self._clear_buffer(self._clear_buffer_timeout, logger)
+        return result_output
@@ -0,0 +1,42 @@
+import re
+from unittest import TestCase
+
+from mock import MagicMock, patch
+
+from cloudshell.networking.cisco.iosxr.cli.cisco_iosxr_cli_handler import CiscoIOSXRCliHandler, \
+    TERMINAL_SETTINGS_PROMPT
+
+
+class TestCiscoIOSXRCliHandler(TestCase):
+    def setUp(self):
+        self.handler = CiscoIOSXRCliHandler(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        self.prompt = "RP/0/RSP0/CPU0:ios#"
+
+    @patch("cloudshell.networking.cisco.iosxr.cli.cisco_iosxr_cli_handler.CliServiceImpl")
+    def test_on_session_start_sends_terminal_settings_at_once(self, cli_service_mock):
+        # Act
+        self.handler.on_session_start(MagicMock(), MagicMock())
+
+        # Assert
+        cli_service_mock.return_value.send_command.assert_called_once_with(
+            "terminal length 0\nterminal width 300", TERMINAL_SETTINGS_PROMPT, remove_command_from_output=False)
+
+    def test_terminal_settings_prompt_skips_first_command_prompt(self):
+        # Setup
+        output = "terminal length 0\r\n{0}".format(self.prompt)
+
+        # Act
+        result = re.search(TERMINAL_SETTINGS_PROMPT, output, re.DOTALL)
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_terminal_settings_prompt_matches_last_command_prompt(self):
+        # Setup
+        output = "terminal length 0\r\n{0}terminal width 300\r\n{0}".format(self.prompt)
+
+        # Act
+        result = re.search(TERMINAL_SETTINGS_PROMPT, output, re.DOTALL)
+
+        # Assert
+        self.assertIsNotNone(result)
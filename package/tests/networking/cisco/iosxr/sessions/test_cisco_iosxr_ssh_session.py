@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from mock import MagicMock
+
+from cloudshell.cli.session.session_exceptions import SessionLoopLimitException
+from cloudshell.networking.cisco.cli.cisco_command_modes import EnableCommandMode
+from cloudshell.networking.cisco.iosxr.sessions.cisco_iosxr_ssh_session import CiscoIOSXRSSHSession
+
+
+class TestCiscoIOSXRSSHSession(TestCase):
+    def setUp(self):
+        self.session = CiscoIOSXRSSHSession("host", "user", "password")
+        self.prompt = "RP/0/RSP0/CPU0:ios#"
+
+    def test_buffer_size(self):
+        # Assert
+        self.assertEqual(CiscoIOSXRSSHSession.BUFFER_SIZE, self.session._buffer_size)
+
+    def _prepare_session(self, *chunks):
+        self.session._clear_buffer = MagicMock(return_value="")
+        self.session.send_line = MagicMock()
+        self.session._receive_all = MagicMock(side_effect=chunks)
+
+    def test_hardware_expect_matches_prompt_in_last_chunk(self):
+        # Setup
+        chunks = ["x" * 100000, "output line\n" + self.prompt]
+        self._prepare_session(*chunks)
+
+        # Act
+        result = self.session.hardware_expect("show running-config", EnableCommandMode.PROMPT, MagicMock())
+
+        # Assert
+        self.assertEqual("".join(chunks), result)
+
+    def test_hardware_expect_skips_output_before_overlap(self):
+        # Setup
+        self._prepare_session("start" + "x" * 100000, "end", "")
+
+        # Act
+        with self.assertRaises(SessionLoopLimitException):
+            self.session.hardware_expect("show running-config", r"start.*end", MagicMock(), retries=1,
+                                         empty_loop_timeout=0.01)
+
+    def test_hardware_expect_runs_action_found_in_last_chunk(self):
+        # Setup
+        logger = MagicMock()
+        action = MagicMock()
+        self._prepare_session("x" * 100000 + "[confirm]", self.prompt)
+
+        # Act
+        result = self.session.hardware_expect("reload", EnableCommandMode.PROMPT, logger,
+                                              action_map={r"\[confirm\]": action})
+
+        # Assert
+        action.assert_called_once_with(self.session, logger)
+        self.assertTrue(result.endswith(self.prompt))
+
+    def test_hardware_expect_matches_prompt_split_between_reads(self):
+        # Setup
+        chunks = ["x" * 100000 + "output line\nRP/0/RSP0/", "CPU0:ios#"]
+        self._prepare_session(*chunks)
+
+        # Act
+        result = self.session.hardware_expect("show running-config", r"RP/0/RSP0/CPU0:ios#\s*$", MagicMock())
+
+        # Assert
+        self.assertEqual("".join(chunks), result)
@@ -30,15 +30,24 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         super(CiscoIOSXRResourceDriver, self).__init__()
         self._cli = None
 
+    def _get_resource_config(self, context):
+        """Build resource configuration from the command context
+
+        :param context: command context with all Resource Attributes inside
+        :rtype: cloudshell.devices.standards.networking.configuration_attributes_structure.GenericNetworkingResource
+        """
+
+        return create_networking_resource_from_context(shell_name=self.SHELL_NAME,
+                                                       supported_os=self.SUPPORTED_OS,
+                                                       context=context)
+
     def initialize(self, context):
         """Initialize method
 
         :type context: cloudshell.shell.core.context.driver_context.InitCommandContext
         """
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         session_pool_size = int(resource_config.sessions_concurrency_limit)
         self._cli = get_cli(session_pool_size)
@@ -56,9 +65,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
         cli_handler = CliHandler(self._cli, resource_config, logger, api)
         snmp_handler = SNMPHandler(resource_config, logger, api, cli_handler)
 
@@ -81,9 +88,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         cli_handler = CliHandler(self._cli, resource_config, logger, api)
         send_command_operations = CommandRunner(logger=logger, cli_handler=cli_handler)
@@ -103,9 +108,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         cli_handler = CliHandler(self._cli, resource_config, logger, api)
         send_command_operations = CommandRunner(logger=logger, cli_handler=cli_handler)
@@ -127,15 +130,14 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         cli_handler = CliHandler(self._cli, resource_config, logger, api)
         connectivity_operations = ConnectivityRunner(logger=logger, cli_handler=cli_handler)
-        logger.info('Start applying connectivity changes, request is: {0}'.format(str(request)))
+        logger.info('Start applying connectivity changes')
+        logger.debug('Connectivity changes request: %s', request)
         result = connectivity_operations.apply_connectivity_changes(request=request)
-        logger.info('Finished applying connectivity changes, response is: {0}'.format(str(result)))
+        logger.info('Finished applying connectivity changes, response is: %s', result)
         logger.info('Apply Connectivity changes completed')
         return result
 
@@ -152,9 +154,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         if not configuration_type:
             configuration_type = 'running'
@@ -187,9 +187,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         if not configuration_type:
             configuration_type = 'running'
@@ -226,9 +224,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         cli_handler = CliHandler(self._cli, resource_config, logger, api)
         configuration_operations = ConfigurationRunner(cli_handler=cli_handler,
@@ -252,9 +248,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         cli_handler = CliHandler(self._cli, resource_config, logger, api)
         configuration_operations = ConfigurationRunner(cli_handler=cli_handler,
@@ -280,9 +274,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         if not vrf_management_name:
             vrf_management_name = resource_config.vrf_management_name
@@ -295,7 +287,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
                                              features_to_install=features_to_install)
         response = firmware_operations.load_firmware(path=path,
                                                      vrf_management_name=vrf_management_name)
-        logger.info('Finish Load Firmware: {}'.format(response))
+        logger.info('Finish Load Firmware: %s', response)
         return response
 
     def health_check(self, context):
@@ -309,9 +301,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
         cli_handler = CliHandler(self._cli, resource_config, logger, api)
 
         state_operations = StateRunner(logger=logger, api=api, resource_config=resource_config, cli_handler=cli_handler)
@@ -330,9 +320,7 @@ class CiscoIOSXRResourceDriver(ResourceDriverInterface, NetworkingResourceDriver
         logger = get_logger_with_thread_id(context)
         api = get_api(context)
 
-        resource_config = create_networking_resource_from_context(shell_name=self.SHELL_NAME,
-                                                                  supported_os=self.SUPPORTED_OS,
-                                                                  context=context)
+        resource_config = self._get_resource_config(context)
 
         cli_handler = CliHandler(self._cli, resource_config, logger, api)
         state_operations = StateRunner(logger=logger, api=api, resource_config=resource_config, cli_handler=cli_handler)
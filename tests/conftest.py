@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Shared fixtures for `CiscoIOSXRResourceDriver` tests
+"""
+
+from collections import namedtuple
+
+import pytest
+from mock import MagicMock, patch
+
+from src import driver as _driver_mod
+from src.driver import CiscoIOSXRResourceDriver
+
+# Runner methods called by the driver, each of them returns '' unless a test overrides it
+RUNNER_METHODS = {
+    'AutoloadRunner': ('discover',),
+    'CommandRunner': ('run_custom_command', 'run_custom_config_command'),
+    'StateRunner': ('health_check', 'shutdown'),
+    'FirmwareRunner': ('load_firmware',),
+    'ConfigurationRunner': ('save', 'restore', 'orchestration_save', 'orchestration_restore'),
+    'ConnectivityRunner': ('apply_connectivity_changes',),
+}
+
+PatchedDriver = namedtuple('PatchedDriver', 'driver api logger resource_details')
+
+
+@pytest.fixture(scope='session')
+def session_context():
+    return MagicMock()
+
+
+@pytest.fixture
+def mocked_context(session_context):
+    """Context mock shared by the whole session, with calls recorded by previous tests cleared"""
+
+    session_context.reset_mock()
+    return session_context
+
+
+@pytest.fixture(scope='module')
+def patched_driver():
+    """Driver instance with its CloudShell helpers patched, shared by all tests of a module"""
+
+    with patch.object(_driver_mod, 'get_api') as mocked_api, \
+            patch.object(_driver_mod, 'get_logger_with_thread_id') as mocked_logger, \
+            patch.object(_driver_mod, 'create_networking_resource_from_context') as mocked_resource_details:
+        yield PatchedDriver(driver=CiscoIOSXRResourceDriver(),
+                            api=mocked_api,
+                            logger=mocked_logger,
+                            resource_details=mocked_resource_details)
+
+
+@pytest.fixture
+def resource_config(patched_driver):
+    patched_driver.resource_details.return_value = MagicMock()
+    return patched_driver.resource_details.return_value
+
+
+@pytest.fixture
+def runner_mocks():
+    mocks = {}
+    for name, methods in RUNNER_METHODS.items():
+        mocks[name] = MagicMock(name=name, **{'return_value.{}.return_value'.format(method): ''
+                                              for method in methods})
+    with patch.multiple(_driver_mod, **mocks):
+        yield mocks
+
+
+@pytest.fixture
+def configuration_runner(runner_mocks):
+    return runner_mocks['ConfigurationRunner'].return_value